@@ -1,10 +1,16 @@
+import time
+from collections import deque
+from typing import Final
+
 import streamlit as st
 
-st.set_page_config(page_title="Special Relativity Toolkit", layout="centered")
+_PAGE_CFG: Final[dict] = {"page_title": "Special Relativity Toolkit", "layout": "centered"}
+
+_TITLE: Final[str] = "🚀 Special Relativity Toolkit "
 
-st.title("🚀 Special Relativity Toolkit ")
+_FOOTER: Final[str] = "Developed by Shivraj Deshmukh — © 2025"
 
-st.markdown("""
+_LANDING_MD: Final[str] = """
 Welcome to the **Special Relativity Simulation Suite** — an interactive educational toolkit designed 
 to explore the physical and mathematical consequences of Einstein's theory through intuitive visualizations 
 and quick-access calculators.
@@ -31,7 +37,38 @@ For feedback, suggestions, or academic correspondence, you may contact:
 ---
 
 Select a module from the sidebar to begin.
-""")
+"""
+
+st.set_page_config(**_PAGE_CFG)
+
+@st.cache_data(show_spinner=False)
+def _landing_md() -> str:
+    return _LANDING_MD
+
+_DEBUG = st.query_params.get("debug") == "1"
+
+@st.fragment
+def render_home():
+    st.title(_TITLE)
+    if _DEBUG:
+        t0 = time.perf_counter()
+        landing_md = _landing_md()
+        st.session_state.setdefault("_home_cache_timings", deque(maxlen=100)).append(time.perf_counter() - t0)
+    else:
+        landing_md = _landing_md()
+    st.markdown(landing_md)
+    st.info(_FOOTER)
+
+render_home()
 
-st.info("Developed by Shivraj Deshmukh — © 2025")
+# ---------------- Cache Diagnostics (?debug=1) ----------------
+if _DEBUG:
+    st.sidebar.markdown("#### 🛠️ Cache diagnostics")
+    timings = list(st.session_state.get("_home_cache_timings", ()))
+    st.sidebar.write({
+        "calls": len(timings),
+        "oldest retained (ms)": 1e3 * timings[0] if timings else None,
+        "last call (ms)": 1e3 * timings[-1] if timings else None,
+        "mean (ms)": 1e3 * sum(timings) / len(timings) if timings else None,
+    })
 
@@ -0,0 +1,28 @@
+from functools import lru_cache
+
+import numpy as np
+import streamlit as st
+
+# — Per-session Matplotlib figures —
+# Drop-in for plt.subplots(): the Figure/Axes are built once per session and
+# cleared on later reruns instead of being reallocated. A bare Figure is used
+# (not plt.figure) so pyplot does not keep every session's figure alive.
+def session_subplots(key, nrows=1, ncols=1, **fig_kw):
+    if key not in st.session_state:
+        from matplotlib.figure import Figure # deferred until a page actually plots
+        fig = Figure(**fig_kw)
+        st.session_state[key] = (fig, fig.subplots(nrows, ncols))
+    fig, axes = st.session_state[key]
+    for ax in fig.axes:
+        ax.cla()
+    return fig, axes
+
+# — Visible-spectrum colour lookup table —
+# jet colormap sampled once per process (page scripts re-run their module
+# globals on every rerun, so the table lives here). Read-only: copy before editing.
+@lru_cache(maxsize=None)
+def spectrum_lut(n=1000):
+    from matplotlib import colormaps
+    lut = colormaps["jet"](np.linspace(0.0, 1.0, n))
+    lut.flags.writeable = False
+    return lut
@@ -2,8 +2,8 @@
 
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import fsolve
+from figures import session_subplots
+from sr_utils import gamma
 
 st.set_page_config(page_title="Relativistic Collision Simulator", layout="centered")
 st.title("\U0001F4A8 Relativistic Collision Simulator")
@@ -42,41 +42,44 @@ with col2:
 
 mode = st.radio("Collision type:", ["Elastic", "Perfectly Inelastic"])
 
-def gamma(v):
-    return 1 / np.sqrt(1 - v**2)
-
-# ---------------- Pre-Collision ----------------
-g1, g2 = gamma(v1), gamma(v2)
-E1, E2 = g1 * m1, g2 * m2
-p1, p2 = g1 * m1 * v1, g2 * m2 * v2
-E_total, p_total = E1 + E2, p1 + p2
-
-# ---------------- Collision ----------------
+@st.cache_data(max_entries=128)
+def compute_collision(m1, m2, v1, v2, mode):
+    # ---------------- Pre-Collision ----------------
+    # One array entry per particle, ready for N-particle extension
+    m = np.array([m1, m2])
+    v = np.array([v1, v2])
+    inv_g = np.sqrt((1 - v) * (1 + v))
+    E = m / inv_g
+    p = E * v
+    E_total, p_total = E.sum(), p.sum()
+    res = dict(E1=E[0], E2=E[1], p1=p[0], p2=p[1], E_total=E_total, p_total=p_total)
+
+    # ---------------- Collision ----------------
+    if mode == "Perfectly Inelastic":
+        # Correct relativistic treatment
+        vf = p_total / E_total
+        res.update(vf=vf, gf=gamma(vf), M=np.sqrt(E_total**2 - p_total**2),
+                   E_final=E_total, p_final=p_total)
+    else:
+        # Closed form: boost to the CoM frame, reverse both velocities, boost back
+        v_cm = p_total / E_total
+        v_boost = (v - v_cm) / (1 - v * v_cm)
+        # Elastic in 1D: velocities reverse in the CoM frame, then boost back
+        vf = (-v_boost + v_cm) / (1 - v_boost * v_cm)
+        Ef = m / np.sqrt((1 - vf) * (1 + vf))
+        pf = Ef * vf
+        res.update(v1f=vf[0], v2f=vf[1], E1f=Ef[0], E2f=Ef[1], p1f=pf[0], p2f=pf[1])
+    return res
+
+res = compute_collision(m1, m2, v1, v2, mode)
+E1, E2, p1, p2 = res["E1"], res["E2"], res["p1"], res["p2"]
+E_total, p_total = res["E_total"], res["p_total"]
 if mode == "Perfectly Inelastic":
-    # Correct relativistic treatment
-    vf = p_total / E_total
-    gf = gamma(vf)
-    M = np.sqrt(E_total**2 - p_total**2)
-    E_final = E_total
-    p_final = p_total
-    v1f = v2f = vf
-    E1f = E2f = None
-    p1f = p2f = None
+    vf, gf, M = res["vf"], res["gf"], res["M"]
+    E_final, p_final = res["E_final"], res["p_final"]
 else:
-    def to_solutions(vars):
-        v1f, v2f = vars
-        g1f, g2f = gamma(v1f), gamma(v2f)
-        p1f = g1f * m1 * v1f
-        p2f = g2f * m2 * v2f
-        E1f = g1f * m1
-        E2f = g2f * m2
-        return [p1f + p2f - p_total, E1f + E2f - E_total]
-
-    guess = [v2, v1]  # reverse guess
-    v1f, v2f = fsolve(to_solutions, guess)
-    g1f, g2f = gamma(v1f), gamma(v2f)
-    E1f, E2f = g1f * m1, g2f * m2
-    p1f, p2f = g1f * m1 * v1f, g2f * m2 * v2f
+    v1f, v2f = res["v1f"], res["v2f"]
+    E1f, E2f, p1f, p2f = res["E1f"], res["E2f"], res["p1f"], res["p2f"]
 
 # ---------------- Output Display ----------------
 st.subheader("\U0001F4C8 Results")
@@ -118,7 +121,7 @@ else:
     energy_labels = ['E_initial', 'E_final']
     energy_values = [E_total, E_final]
 
-fig, ax = plt.subplots(1, 2, figsize=(10, 4))
+fig, ax = session_subplots("fig_collision", 1, 2, figsize=(10, 4))
 
 ax[0].bar(labels, momentum_values, color='gray')
 ax[0].set_title("Momentum")
@@ -128,7 +131,7 @@ ax[1].bar(energy_labels, energy_values, color='gray')
 ax[1].set_title("Energy")
 ax[1].axhline(0, color='black', linewidth=0.5)
 
-st.pyplot(fig)
+st.pyplot(fig, clear_figure=False)
 
 # ---------------- Footer ----------------
 st.markdown("""
@@ -1,6 +1,6 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+from figures import session_subplots
 
 # Page config
 st.set_page_config(
@@ -59,10 +59,11 @@ x_p = np.sin(theta_prime) * np.cos(phi)
 y_p = np.sin(theta_prime) * np.sin(phi)
 
 # Force a dark style so white points show up
+import matplotlib.pyplot as plt # imported here, at first use
 plt.style.use("dark_background")
 
 # Plot side by side
-fig, (ax0, ax1) = plt.subplots(1, 2, figsize=(10, 5))
+fig, (ax0, ax1) = session_subplots("fig_aberration", 1, 2, figsize=(10, 5))
 for ax, X, Y, title in [
     (ax0, x,   y,   "Starfield in Rest Frame"),
     (ax1, x_p, y_p, "Starfield in Moving Frame")
@@ -74,10 +75,10 @@ for ax, X, Y, title in [
 
 # Ensure the figure itself is black
 fig.patch.set_facecolor("black")
-plt.tight_layout()
+fig.tight_layout()
 
 
-st.pyplot(fig)
+st.pyplot(fig, clear_figure=False)
 
 st.info("""
 At high speeds, stars appear to cluster toward the direction of motion :  
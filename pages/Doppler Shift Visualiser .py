@@ -1,6 +1,8 @@
+import math
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+from figures import session_subplots, spectrum_lut
+from sr_native import doppler_factor
 
 # --- Setup ---
 st.set_page_config(page_title="Cosmic Doppler Shift Explorer", layout="centered")
@@ -35,19 +37,22 @@ else:
     λ_emit = λ_emit_m * 1e9
 
 # --- Doppler Shift Calculations ---
-beta = v_frac
-# The factor formula is correct for frequency shift (positive beta = recession)
-# f_obs = f_emit * sqrt((1 - beta) / (1 + beta))
-factor_freq = np.sqrt((1 - beta) / (1 + beta))
-f_obs = f_emit * factor_freq
+@st.cache_data(max_entries=128)
+def compute_doppler(v_frac, f_emit, λ_emit):
+    beta = v_frac
+    # The factor formula is correct for frequency shift (positive beta = recession)
+    # f_obs = f_emit * sqrt((1 - beta) / (1 + beta))
+    factor_freq = doppler_factor(float(beta))
+    f_obs = f_emit * factor_freq
 
-# lambda_obs = lambda_emit * sqrt((1 + beta) / (1 - beta))
-# Note: The LaTeX in your original code shows lambda_obs = lambda_emit * sqrt((1 + v/c) / (1 - v/c))
-# This is equivalent to lambda_obs = lambda_emit / factor_freq
-λ_obs_m = c / f_obs
-λ_obs = λ_obs_m * 1e9
+    # lambda_obs = lambda_emit * sqrt((1 + beta) / (1 - beta)) = lambda_emit / factor_freq, in nm directly
+    λ_obs = λ_emit / factor_freq
 
-z = (λ_obs - λ_emit) / λ_emit
+    # z = sqrt((1 + beta) / (1 - beta)) - 1 = exp(atanh(beta)) - 1, stable for small |beta|
+    z = math.expm1(math.atanh(beta))
+    return f_obs, λ_obs, z
+
+f_obs, λ_obs, z = compute_doppler(v_frac, f_emit, λ_emit)
 
 
 # --- Results ---
@@ -71,15 +76,19 @@ with col3:
 # --- Spectrum Plot ---
 st.subheader("🌈 Shifted Spectrum Visualization")
 
-wavelengths = np.linspace(380, 750, 1000)
-spectrum = np.exp(-0.5 * ((wavelengths - λ_obs)/10)**2)  # Gaussian at observed wavelength
+@st.cache_data(max_entries=128)
+def compute_spectrum(λ_obs):
+    wavelengths = np.linspace(380, 750, 1000)
+    spectrum = np.exp(-0.5 * ((wavelengths - λ_obs)/10)**2)  # Gaussian at observed wavelength
+    return wavelengths, spectrum
+
+wavelengths, spectrum = compute_spectrum(λ_obs)
 
-fig, ax = plt.subplots(figsize=(8, 1.5))
-for i in range(len(wavelengths) - 1):
-    # This creates a smooth color gradient across the visible spectrum
-    color_normalized = (wavelengths[i] - 380) / (750 - 380)
-    color = plt.cm.jet(color_normalized) # Jet or viridis might be better than hsv for spectrum representation
-    ax.axvspan(wavelengths[i], wavelengths[i+1], color=color, alpha=spectrum[i])
+# Smooth color gradient across the visible spectrum as a (1, 1000, 4) RGBA image
+img = spectrum_lut()[None, :, :].copy() # Jet or viridis might be better than hsv for spectrum representation
+img[..., 3] = spectrum
+fig, ax = session_subplots("fig_doppler", figsize=(8, 1.5))
+ax.imshow(img, extent=[380, 750, 0, 1], aspect='auto', origin='lower')
 
 # Plotting the peak of the observed wavelength
 ax.axvline(λ_obs, color='white', linestyle='--', label=f"Observed $\\lambda = {λ_obs:.1f}$ nm")
@@ -90,7 +99,7 @@ ax.set_yticks([])
 ax.set_xlabel("Wavelength (nm)")
 ax.set_title("Simulated Spectrum Shift")
 ax.legend()
-st.pyplot(fig)
+st.pyplot(fig, clear_figure=False)
 
 
 # --- Info Box ---
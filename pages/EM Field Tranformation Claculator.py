@@ -1,5 +1,6 @@
 import streamlit as st
 import numpy as np
+import sr_utils
 
 st.set_page_config(page_title="Lorentz & EM Transformer", page_icon="🧲", layout="centered")
 st.title("🧲 Lorentz Field Transformer & EM Tensor Calculator")
@@ -40,7 +41,7 @@ with col2:
 
 # Lorentz Transformation
 v_frac = st.slider("Boost velocity (fraction of c)", 0.0, 0.99, 0.6)
-gamma = 1 / np.sqrt(1 - v_frac**2)
+gamma = sr_utils.gamma(v_frac)
 v = v_frac  # dimensionless v in natural units
 
 # Transformed Electric Field
@@ -1,10 +1,10 @@
 import streamlit as st
 from PIL import Image
+import base64
+import io
+import math
 import numpy as np
-from mpmath import mp
-
-# High precision for near-c speeds
-mp.dps = 100
+from sr_utils import one_minus_v2
 
 # Streamlit config
 st.set_page_config(page_title="Length Contraction Simulator", layout="centered")
@@ -25,57 +25,73 @@ st.markdown(r"""
 # Velocity input
 v_input = st.text_input("Enter velocity as a fraction of c (0 < v < 1):", "0.9")
 
+# Velocity validation, done before any image work so partial input is cheap
+v_valid = True
+try:
+    v = float(v_input.strip())
+    contracted_fraction = math.sqrt(one_minus_v2(v_input))
+except:
+    v_valid = False
+
 # Image options
 st.subheader("Choose an Image")
 preset = st.checkbox("Use preset spaceship image")
 uploaded_file = st.file_uploader("Or upload your own image (PNG/JPG)", type=["png", "jpg", "jpeg"])
 
+# Widgets above stay rendered (keeping any upload); stop before opening the image
+if not v_valid:
+    st.error("Invalid velocity. Must be a number strictly between 0 and 1.")
+    st.stop()
+
+# Cap the original width for layout purposes to prevent overly large images
+max_orig_width = 600
+
+# Decoded and downscaled once per source (preset path or upload id); the source
+# object itself is not hashed, so reruns do no per-pixel work
+@st.cache_data(max_entries=8, show_spinner=False)
+def load_display_image(source_key, _source):
+    image = Image.open(_source).convert("RGBA")
+    orig_w, orig_h = image.size
+    scale = min(max_orig_width / orig_w, 1.0) # Ensure image doesn't get scaled up if already small
+    disp_size = (int(orig_w * scale), int(orig_h * scale))
+    if scale < 1.0:
+        image = image.resize(disp_size, Image.BICUBIC)
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    png = buf.getvalue()
+    return (orig_w, orig_h), disp_size, png, "data:image/png;base64," + base64.b64encode(png).decode()
+
 if preset:
     try:
         # NOTE: If 'spaceship.png' is in an 'images' subfolder, use the relative path:
-        image = Image.open("images/spaceship.png").convert("RGBA")
+        image_info = load_display_image("images/spaceship.png", "images/spaceship.png")
         st.success("Using preset spaceship image from 'images' folder.")
     except FileNotFoundError:
         st.error("Missing file: 'images/spaceship.png'. Please ensure it's in the 'images' folder.")
         st.stop()
 elif uploaded_file:
-    image = Image.open(uploaded_file).convert("RGBA")
+    image_info = load_display_image(uploaded_file.file_id, uploaded_file)
     st.success("Using uploaded image.")
 else:
     st.warning("Please select a preset or upload an image.")
     st.stop()
 
-# Velocity validation
-try:
-    v = mp.mpf(v_input.strip())
-    if v <= 0 or v >= 1:
-        raise ValueError
-except:
-    st.error("Invalid velocity. Must be a number strictly between 0 and 1.")
-    st.stop()
+(orig_w, orig_h), (disp_orig_w, disp_h), disp_png, disp_uri = image_info
 
 # Lorentz contraction calculations
-gamma = 1/mp.sqrt(1 - v**2)
-contracted_fraction = 1/gamma
-contraction_percent = (1 - contracted_fraction)*100
+gamma = 1/contracted_fraction
+contraction_percent = v*v/(1 + contracted_fraction)*100 # = 1 - 1/γ without cancellation
 
-# Resize image horizontally only
-orig_w, orig_h = image.size
-new_w = int(orig_w * float(contracted_fraction)) # Cast to float for Pillow's resize
-contracted_image = image.resize((new_w, orig_h), Image.BICUBIC)
+# Contract horizontally only; the browser does the scaling, no server-side resample
+new_w = int(orig_w * contracted_fraction)
+disp_new_w = max(1, int(disp_orig_w * contracted_fraction))
 
 # Display results (vertical stack)
 st.subheader("Results")
 
-# Cap the original width for layout purposes to prevent overly large images
-max_orig_width = 600
-scale = min(max_orig_width / orig_w, 1.0) # Ensure image doesn't get scaled up if already small
-disp_orig_w = int(orig_w * scale)
-disp_new_w  = int(new_w  * scale)
-
 # Original image
 st.image(
-    image,
+    disp_png,
     caption=f"Original (Rest Frame) – {orig_w}px",
     width=disp_orig_w
 )
@@ -85,10 +101,10 @@ st.markdown("<div style='height:100px'></div>", unsafe_allow_html=True)
 
 st.markdown("**Contracted image is:**")
 
-# Contracted image
-st.image(
-    contracted_image,
-    width=disp_new_w
+# Contracted image (display-size copy stretched to the contracted width via CSS)
+st.markdown(
+    f"<img src='{disp_uri}' style='width:{disp_new_w}px; height:{disp_h}px;'>",
+    unsafe_allow_html=True
 )
 
 # Separator
@@ -97,11 +113,11 @@ st.markdown("---")
 # Summary
 st.markdown(f"""
 ### 📉 Contraction Summary
-- **Lorentz Factor (γ)**: `{mp.nstr(gamma, 20)}`
+- **Lorentz Factor (γ)**: `{gamma:.15g}`
 - **Original Width**: `{orig_w}px`
 - **Contracted Width**: `{new_w}px`
-- **Contraction Fraction**: `{float(contracted_fraction):.5f}`
-- **Contraction**: `{float(contraction_percent):.2f}%`
+- **Contraction Fraction**: `{contracted_fraction:.5f}`
+- **Contraction**: `{contraction_percent:.2f}%`
 - **Direction**: Horizontal only (length parallel to motion)
 """)
 
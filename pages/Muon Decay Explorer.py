@@ -1,10 +1,8 @@
+import math
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from mpmath import mp
-
-# Set decimal precision (e.g., 100 digits for extreme accuracy)
-mp.dps = 100
+from figures import session_subplots
+from sr_utils import one_minus_v2
 
 # Streamlit Setup
 st.set_page_config(page_title="Muon Lifetime Simulator", layout="centered")
@@ -15,9 +13,9 @@ Muons are created ~10–15 km above Earth's surface by cosmic rays. Their rest-f
 yet they are observed in abundance at ground level. This simulator shows how **time dilation** allows them to survive.
 """)
 
-# ---------- Constants (defined as mpmath objects for high precision calculations) ----------
-c_mp = mp.mpf(3e8)  # speed of light in m/s
-tau_0_mp = mp.mpf(2.2e-6)  # muon lifetime in seconds (rest frame)
+# ---------- Constants ----------
+c = 3e8  # speed of light in m/s
+tau_0 = 2.2e-6  # muon lifetime in seconds (rest frame)
 
 # ---------- Centered Inputs ----------
 st.markdown("### 🔧 Simulation Controls")
@@ -34,41 +32,55 @@ with col2:
 with col3:
     N0 = st.number_input("Initial Muon Count", min_value=1000, value=10000, step=1000)
 
-# ---------- Input Validation and Calculations with mpmath ----------
-try:
-    # Convert v_frac string to mpmath float
-    v_frac_mp = mp.mpf(v_frac_str.strip())
-
-    # Validate velocity range
-    if v_frac_mp <= 0 or v_frac_mp >= 1:
-        raise ValueError("Velocity (v/c) must be strictly between 0 and 1.")
-
-    # Convert other inputs to mpmath for consistent high-precision calculations
-    h_mp = mp.mpf(h_km * 1000)  # Convert km to meters as mpmath float
-    N0_mp = mp.mpf(N0)
-
-    # Calculate v in m/s using mpmath
-    v_mp = v_frac_mp * c_mp
-
-    # Calculate Lorentz Factor (gamma) using mpmath
-    gamma_mp = 1 / mp.sqrt(1 - (v_mp/c_mp)**2)
+# ---------- Input Validation and Calculations ----------
+@st.cache_data(max_entries=128)
+def compute_muon_curves(h_km, v_frac_str, N0):
+    v_frac = float(v_frac_str.strip())
+
+    # Validates 0 < v/c < 1 and keeps γ accurate for v/c extremely close to 1
+    gamma = 1.0 / math.sqrt(one_minus_v2(v_frac_str))
+
+    h = h_km * 1000  # Convert km to meters
+    # v/c below float range (e.g. 1e-400) would make v exactly 0; the smallest
+    # positive float keeps t_Earth = inf instead of dividing by zero
+    v = max(v_frac * c, math.ulp(0.0))
+    t_Earth = h / v
+    tau_dilated = gamma * tau_0
+
+    # Decay exponents are kept in log space so extreme cases don't underflow
+    log_ratio_SR = -t_Earth / tau_dilated
+    log_ratio_classical = -t_Earth / tau_0
+
+    # 128 samples is plenty for a smooth exponential at screen resolution
+    altitudes = np.linspace(0, h, 128)
+    with np.errstate(over="ignore"):
+        times = altitudes / v
+    inv_tau_dil = 1.0 / tau_dilated
+    inv_tau0 = 1.0 / tau_0
+
+    muons_SR = N0 * np.exp(-times * inv_tau_dil)
+    muons_classical = N0 * np.exp(-times * inv_tau0)
+
+    return {
+        "gamma": gamma,
+        "t_Earth": t_Earth,
+        "tau_dilated": tau_dilated,
+        "N_survive": N0 * math.exp(log_ratio_SR),
+        "N_decay_classical": N0 * math.exp(log_ratio_classical),
+        "log10_survive_SR": log_ratio_SR / math.log(10),
+        "log10_survive_classical": log_ratio_classical / math.log(10),
+        "altitudes": altitudes,
+        "muons_SR": muons_SR,
+        "muons_classical": muons_classical,
+    }
 
-    # Calculate time taken in Earth's frame (t_Earth) using mpmath
-    t_Earth_mp = h_mp / v_mp
-
-    # Calculate Dilated Lifetime (tau_dilated) using mpmath
-    tau_dilated_mp = gamma_mp * tau_0_mp
-
-    # Calculate survival counts using mp.exp for high precision in exponential decay
-    N_survive_mp = N0_mp * mp.exp(-t_Earth_mp / tau_dilated_mp)
-    N_decay_classical_mp = N0_mp * mp.exp(-t_Earth_mp / tau_0_mp)
-
-    # Convert final results back to standard floats for display and numpy/matplotlib compatibility
-    gamma = float(gamma_mp)
-    t_Earth = float(t_Earth_mp)
-    tau_dilated = float(tau_dilated_mp)
-    N_survive = float(N_survive_mp)
-    N_decay_classical = float(N_decay_classical_mp)
+try:
+    res = compute_muon_curves(h_km, v_frac_str, N0)
+    gamma = res["gamma"]
+    t_Earth = res["t_Earth"]
+    tau_dilated = res["tau_dilated"]
+    N_survive = res["N_survive"]
+    N_decay_classical = res["N_decay_classical"]
 
 except Exception as e:
     st.error(f"Invalid input or calculation error: {e}. Please ensure velocity is a valid number between 0 and 1.")
@@ -95,15 +107,9 @@ st.markdown("---")
 # ---------- Plot: Muon Survival Comparison ----------
 st.subheader("📈 Muon Survival: With and Without Relativity")
 
-# Ensure plot data is generated using standard floats compatible with numpy/matplotlib
-altitudes = np.linspace(0, float(h_mp), 500)
-times = altitudes / float(v_mp) # Convert v_mp to float for numpy array division
-
-# The original tau_0 constant is used for the classical plot, which is already a float
-muons_SR = N0 * np.exp(-times / tau_dilated)
-muons_classical = N0 * np.exp(-times / float(tau_0_mp)) # Use the float version of tau_0_mp for this calculation
+altitudes, muons_SR, muons_classical = res["altitudes"], res["muons_SR"], res["muons_classical"]
 
-fig, ax = plt.subplots(figsize=(8, 5))
+fig, ax = session_subplots("fig_muon", figsize=(8, 5))
 ax.plot(altitudes / 1000, muons_SR, label="With Time Dilation (Relativity)", color='blue')
 ax.plot(altitudes / 1000, muons_classical, label="Without Time Dilation (Classical)", color='red', linestyle='--')
 ax.axvline(x=h_km, color='gray', linestyle=':', label=f"Surface @ {h_km} km")
@@ -112,14 +118,20 @@ ax.set_ylabel("Surviving Muons")
 ax.set_title("Muon Decay During Descent")
 ax.legend()
 ax.grid(True)
-st.pyplot(fig)
+st.pyplot(fig, clear_figure=False)
 
 # ---------- Final Survival Counts ----------
+log10_SR, log10_classical = res["log10_survive_SR"], res["log10_survive_classical"]
+log10_gain = log10_SR - log10_classical
+if math.isnan(log10_gain): # both exponents -inf: v/c underflowed, so γ = 1 and there is no gain
+    log10_gain = 0.0
+gain = f"{10**log10_gain:.2f}" if log10_gain < 15 else f"10^{log10_gain:.1f}"
+
 st.subheader("📊 Ground-Level Muon Count Comparison")
 st.markdown(f"""
-- **With Relativity:** ~{int(N_survive):,} muons reach the surface
-- **Without Relativity:** ~{int(N_decay_classical):,} muons reach the surface
-- **Time Dilation Gain:** ×{N_survive / N_decay_classical:.2f} more muons survive
+- **With Relativity:** ~{int(N_survive):,} muons reach the surface (log₁₀ N/N₀ = {log10_SR:.4g})
+- **Without Relativity:** ~{int(N_decay_classical):,} muons reach the surface (log₁₀ N/N₀ = {log10_classical:.4g})
+- **Time Dilation Gain:** ×{gain} more muons survive
 """)
 st.markdown("""
 <hr style='margin-top: 50px; margin-bottom: 10px'>
@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+from figures import session_subplots
+import sr_utils
 
 # Streamlit setup
 st.set_page_config(page_title="Proper Time vs Coordinate Time", layout="centered")
@@ -18,7 +19,7 @@ t_max = st.number_input("Total coordinate time on Earth (in arbitrary units):",
 
 
 # Calculations
-gamma = 1 / np.sqrt(1 - v**2)
+gamma = sr_utils.gamma(v)
 t_vals = np.linspace(0, t_max, 300)
 tau_vals = t_vals / gamma  # Proper time for moving observer
 
@@ -28,7 +29,7 @@ col1, col2 = st.columns(2)
 # Plot 1: Proper Time vs Coordinate Time
 with col1:
     st.subheader("📈 Proper Time vs Coordinate Time")
-    fig1, ax1 = plt.subplots(figsize=(5, 4))
+    fig1, ax1 = session_subplots("fig_propertime", figsize=(5, 4))
     ax1.plot(t_vals, tau_vals, color='purple', label=r"$\tau(t) = t \sqrt{1 - v^2}$")
     ax1.plot(t_vals, t_vals, linestyle='--', color='gray', label=r"$t$ (Earth)")
     ax1.set_xlabel(r"Coordinate Time $t$")
@@ -36,12 +37,12 @@ with col1:
     ax1.set_title("Time Experienced by Traveler vs Earth")
     ax1.legend()
     ax1.grid(True)
-    st.pyplot(fig1)
+    st.pyplot(fig1, clear_figure=False)
 
 # Plot 2: Worldlines on Spacetime Diagram
 with col2:
     st.subheader("🌌 Spacetime Worldlines")
-    fig2, ax2 = plt.subplots(figsize=(5, 5))
+    fig2, ax2 = session_subplots("fig_propertime_spacetime", figsize=(5, 5))
     ax2.plot([0, 0], [0, t_max], label="Earth (Rest Frame)", color='blue')
     ax2.plot([0, v * t_max], [0, t_max], label="Traveler", color='red')
     ax2.set_xlim(-1, max(1, v * t_max + 1)) # Adjusted x-lim slightly for better visualization with arbitrary units
@@ -51,7 +52,7 @@ with col2:
     ax2.set_title("Spacetime Diagram")
     ax2.legend()
     ax2.grid(True)
-    st.pyplot(fig2)
+    st.pyplot(fig2, clear_figure=False)
 
 # Results
 st.subheader("✅ Summary")
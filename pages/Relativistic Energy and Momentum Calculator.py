@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt # Added this import for plotting
+from figures import session_subplots
+import sr_utils
 
 # Streamlit page setup
 st.set_page_config(page_title="Energy-Momentum Relation", layout="centered")
@@ -15,10 +16,10 @@ mass = st.number_input("Enter rest mass \( m \):", min_value=0.0, value=1.0, ste
 velocity = st.number_input("Enter velocity \( v \) (as a fraction of \( c \)):", min_value=0.0, max_value=0.999999, value=0.6, step=0.01, format="%.6f")
 
 # Lorentz factor
-gamma = 1 / np.sqrt(1 - velocity**2)
+gamma, beta_gamma = sr_utils.gamma_beta(velocity)
 
 # Compute momentum and energy
-p = gamma * mass * velocity       # p = γmv
+p = beta_gamma * mass             # p = γmv
 E = gamma * mass                  # E = γmc^2 (with c=1)
 E_squared = E**2
 pc_squared = (p)**2
@@ -47,19 +48,21 @@ else:
 # --- START: Integrated Comparative Plot ---
 st.subheader("📈 Relativistic vs Newtonian Momentum")
 
-# Generate velocity values for the plot
-v_vals = np.linspace(0, 0.999, 300) # From 0 up to just below c
+@st.cache_data(max_entries=128)
+def momentum_curves(mass):
+    # Generate velocity values for the plot
+    v = np.linspace(0, 0.999, 300) # From 0 up to just below c
 
-# Calculate relativistic momentum for each v_val
-# Need gamma for each v_val
-gamma_vals_plot = 1 / np.sqrt(1 - v_vals**2)
-p_rel_vals = gamma_vals_plot * mass * v_vals
+    # 1/γ = sqrt((1 - v)(1 + v))
+    inv_g = np.sqrt((1.0 - v) * (1.0 + v))
+    p_new = mass * v
+    p_rel = p_new / inv_g
+    return v, p_rel, p_new
 
-# Calculate Newtonian momentum for each v_val
-p_newton_vals = mass * v_vals
+v_vals, p_rel_vals, p_newton_vals = momentum_curves(mass)
 
 # Create the plot
-fig, ax = plt.subplots(figsize=(8, 5))
+fig, ax = session_subplots("fig_energy_momentum", figsize=(8, 5))
 ax.plot(v_vals, p_rel_vals, label="Relativistic Momentum (γmv)", color='blue')
 ax.plot(v_vals, p_newton_vals, label="Newtonian Momentum (mv)", linestyle='--', color='orange')
 
@@ -71,7 +74,7 @@ ax.legend()
 ax.grid(True)
 
 # Display the plot in Streamlit
-st.pyplot(fig)
+st.pyplot(fig, clear_figure=False)
 # --- END: Integrated Comparative Plot ---
 
 
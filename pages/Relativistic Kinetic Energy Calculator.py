@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from figures import session_subplots
 
 # Streamlit setup
 st.set_page_config(page_title="Kinetic Energy vs Speed", layout="centered")
@@ -34,7 +34,7 @@ v_thresh = v_vals[threshold_idx] if np.any(diff_pct > 0.1) else None
 # --- Plot ---
 st.subheader("📈 Kinetic Energy vs Speed")
 
-fig, ax = plt.subplots(figsize=(8, 5))
+fig, ax = session_subplots("fig_kinetic_energy", figsize=(8, 5))
 ax.plot(v_vals, ke_rel, label="Relativistic KE", color='blue')
 ax.plot(v_vals, ke_newton, label="Newtonian KE", linestyle='--', color='green')
 
@@ -46,7 +46,7 @@ ax.set_ylabel("Kinetic Energy")
 ax.set_title("Relativistic vs Newtonian Kinetic Energy")
 ax.legend()
 ax.grid(True)
-st.pyplot(fig)
+st.pyplot(fig, clear_figure=False)
 
 # --- KE Comparison Table ---
 st.subheader("📊 KE Comparison Table")
@@ -42,12 +42,9 @@ with col2:
 
 # --- Compute and Classify ---
 if st.button("🔍 Check Spacetime Interval"):
-    dt = t2 - t1
-    dx = x2 - x1
-    dy = y2 - y1
-    dz = z2 - z1
-
-    s_squared = (c * dt)**2 - dx**2 - dy**2 - dz**2
+    # (c Δt, Δx, Δy, Δz)
+    deltas = np.array([c * (t2 - t1), x2 - x1, y2 - y1, z2 - z1])
+    s_squared = deltas[0]**2 - (deltas[1:]**2).sum()
 
     st.markdown("### 🧮 Results")
     st.latex(r"s^2 = c^2 (\Delta t)^2 - (\Delta x)^2 - (\Delta y)^2 - (\Delta z)^2")
@@ -57,17 +54,9 @@ if st.button("🔍 Check Spacetime Interval"):
         s_squared_display_latex = r"0 \, \text{m}^2"
     else:
         s_sign = "" if s_squared >= 0 else "-"
-        abs_s_squared = abs(s_squared)
-
-        if abs_s_squared >= 1 or abs_s_squared == 0: # For large numbers or exactly zero
-            exponent = int(np.floor(np.log10(abs_s_squared))) if abs_s_squared > 0 else 0
-            mantissa = abs_s_squared / (10**exponent) if abs_s_squared > 0 else 0.0
-            s_squared_display_latex = rf"{s_sign}{mantissa:.4f} \times 10^{{{exponent}}} \, \text{{m}}^2"
-        else: # For small numbers (0 < abs_s_squared < 1)
-            # Find the exponent for numbers like 0.0001
-            exponent = int(np.floor(np.log10(abs_s_squared)))
-            mantissa = abs_s_squared / (10**exponent)
-            s_squared_display_latex = rf"{s_sign}{mantissa:.4f} \times 10^{{{exponent}}} \, \text{{m}}^2"
+        # Scientific notation straight from the float formatter, e.g. "8.9876e+16"
+        mantissa, _, exponent = f"{abs(s_squared):.4e}".partition("e")
+        s_squared_display_latex = rf"{s_sign}{mantissa} \times 10^{{{int(exponent)}}} \, \text{{m}}^2"
 
     st.latex(rf"s^2 = {s_squared_display_latex}")
     # --- END OF CUSTOM FORMATTING FOR S_SQUARED ---
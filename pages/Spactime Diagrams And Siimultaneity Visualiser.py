@@ -1,7 +1,9 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from sr_native import boost, boost_event
+from figures import session_subplots
+from sr_utils import gamma
 
 # — Page setup —
 st.set_page_config(page_title="Minkowski Diagram Generator", layout="centered")
@@ -18,12 +20,8 @@ xB, tB = st.number_input("Event B – x", 4.0), st.number_input("Event B – t",
 frame = st.radio("Show simultaneity in frame:", ["S (rest frame)", "S′ (moving frame)"])
 
 # — Lorentz helpers —
-def gamma(v): return 1 / np.sqrt(1 - v**2)
 def to_moving_frame(x, t, v):
-    g   = gamma(v)
-    x_p = g * (x - v * t)
-    t_p = g * (t - v * x)
-    return x_p, t_p
+    return boost_event(float(x), float(t), float(v))
 
 # — Compute transformed coords —
 xA_p, tA_p = to_moving_frame(xA, tA, v)
@@ -41,15 +39,16 @@ st.subheader("Event Coordinates in Each Frame")
 st.table(df)
 
 # — Draw Minkowski diagram —
-fig, ax = plt.subplots(figsize=(6,6))
+fig, ax = session_subplots("fig_minkowski", figsize=(6,6))
 
 # --- DYNAMIC SCALING LOGIC ---
-all_coords = [xA, tA, xB, tB, xA_p, tA_p, xB_p, tB_p]
+all_coords = np.array([xA, tA, xB, tB, xA_p, tA_p, xB_p, tB_p])
 # Filter out non-finite values if any appear due to extreme gamma (though unlikely with max_v=0.99)
-all_coords = [c for c in all_coords if np.isfinite(c)]
+finite = all_coords[np.isfinite(all_coords)]
 
-# Calculate max absolute coordinate value
-max_coord_abs = max(abs(c) for c in all_coords) if all_coords else 1.0 # Default to 1.0 if all are 0
+# Calculate max absolute coordinate value; initial= covers the empty case
+# (anything below 1 is lifted to min_plot_lim below anyway)
+max_coord_abs = float(np.abs(finite).max(initial=1.0))
 
 plot_buffer = 1.2 # 20% padding around the max coordinate
 min_plot_lim = 5.0 # Ensure a minimum scale for visibility if coordinates are very small
@@ -84,11 +83,8 @@ if plot_lim > 50:
     grid_step = 10.0
 
 grid_coords = np.arange(-int(plot_lim) - grid_step, int(plot_lim) + grid_step, grid_step)
-
-for t0 in grid_coords:
-    ax.plot(x, np.full_like(x, t0), color='gray', linewidth=0.5, alpha=0.2)
-for x0 in grid_coords:
-    ax.plot(np.full_like(x, x0), x, color='gray', linewidth=0.5, alpha=0.2)
+ax.hlines(grid_coords, -plot_lim, plot_lim, colors='gray', linewidths=0.5, alpha=0.2)
+ax.vlines(grid_coords, -plot_lim, plot_lim, colors='gray', linewidths=0.5, alpha=0.2)
 
 
 # Moving‑frame axes (red)
@@ -100,18 +96,74 @@ ax.plot(v * x, x,        color='red', linewidth=2, label="ct′ axis")
 g_val = gamma(v) # Calculate gamma for plotting once
 # inv_g_val = 1 / g_val # Not explicitly needed after simultaneity line fix
 
-# Use scaled ranges for xp and tp
-xp_grid = np.arange(-int(plot_lim) - grid_step, int(plot_lim) + grid_step, grid_step)
-tp_grid = np.arange(-int(plot_lim) - grid_step, int(plot_lim) + grid_step, grid_step)
-
-for t0p in tp_grid: # Lines of constant t'
-    xs = g_val * (xp_grid + v * t0p)
-    ts = g_val * (t0p + v * xp_grid)
-    ax.plot(xs, ts, color='blue', linewidth=0.7, alpha=0.3)
-for x0p in xp_grid: # Lines of constant x'
-    xs = g_val * (x0p + v * tp_grid)
-    ts = g_val * (tp_grid + v * x0p)
-    ax.plot(xs, ts, color='blue', linewidth=0.7, alpha=0.3)
+@st.cache_data(max_entries=128)
+def compute_minkowski_grid(v, plot_lim, grid_step):
+    # Use scaled ranges for xp and tp
+    xp_grid = np.arange(-int(plot_lim) - grid_step, int(plot_lim) + grid_step, grid_step)
+    tp_grid = np.arange(-int(plot_lim) - grid_step, int(plot_lim) + grid_step, grid_step)
+
+    # Grid lines are straight, so only their endpoints are needed: shape (N, 2)
+    xp_ends = xp_grid[[0, -1]]
+    tp_ends = tp_grid[[0, -1]]
+    # Lines of constant t' (one row per t0p), then lines of constant x' (one row per x0p)
+    xp = np.concatenate((np.broadcast_to(xp_ends, (tp_grid.size, 2)),
+                         np.broadcast_to(xp_grid[:, None], (xp_grid.size, 2))))
+    tp = np.concatenate((np.broadcast_to(tp_grid[:, None], (tp_grid.size, 2)),
+                         np.broadcast_to(tp_ends, (xp_grid.size, 2))))
+
+    # Boost every endpoint from S′ back to S in one call: shape (N, 2, 2)
+    xs, ts = boost(xp.ravel(), tp.ravel(), float(-v))
+    segments = np.stack((xs, ts), axis=-1).reshape(-1, 2, 2)
+    return segments[:tp_grid.size], segments[tp_grid.size:]
+
+# — Grid background —
+# The skewed moving-frame grid is static reference linework, so it is rasterized
+# once per (v, raster_lim, grid_step) into an RGBA image and drawn with a single imshow.
+GRID_PX = 1000
+
+def clip_segments(segments, lim):
+    # Liang–Barsky clip of every segment to the box [-lim, lim]²
+    p0, d = segments[:, 0, :], segments[:, 1, :] - segments[:, 0, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ta, tb = (-lim - p0) / d, (lim - p0) / d
+    t0 = np.fmax(np.fmin(ta, tb).max(axis=1), 0.0)
+    t1 = np.fmin(np.fmax(ta, tb).min(axis=1), 1.0)
+    keep = t0 <= t1
+    p0, d = p0[keep], d[keep]
+    return np.stack((p0 + d * t0[keep, None], p0 + d * t1[keep, None]), axis=1)
+
+def stamp_segments(img, segments, plot_lim, rgb, alpha):
+    # Clipped segments span at most √2·GRID_PX pixels, so 2·GRID_PX samples leave no gaps;
+    # alpha-composite 2px dots onto img
+    s = np.linspace(0.0, 1.0, 2 * GRID_PX)
+    segments = clip_segments(segments, plot_lim)
+    p0, p1 = segments[:, 0, :], segments[:, 1, :]
+    pts = p0[:, None, :] + (p1 - p0)[:, None, :] * s[None, :, None]
+    cols = np.floor((pts[..., 0] + plot_lim) / (2 * plot_lim) * GRID_PX).astype(int).ravel()
+    rows = np.floor((pts[..., 1] + plot_lim) / (2 * plot_lim) * GRID_PX).astype(int).ravel()
+    mask = np.zeros((GRID_PX + 1, GRID_PX + 1), dtype=bool)
+    inside = (cols >= 0) & (cols < GRID_PX) & (rows >= 0) & (rows < GRID_PX)
+    for dr, dc in ((0, 0), (0, 1), (1, 0), (1, 1)):
+        mask[rows[inside] + dr, cols[inside] + dc] = True
+    mask = mask[:GRID_PX, :GRID_PX]
+    # "over" compositing of a flat colour onto what is already drawn
+    dst_a = img[mask, 3:]
+    out_a = alpha + dst_a * (1 - alpha)
+    img[mask, :3] = (alpha * np.asarray(rgb) + dst_a * (1 - alpha) * img[mask, :3]) / out_a
+    img[mask, 3:] = out_a
+
+@st.cache_data(max_entries=16) # ~4 MB per image
+def grid_background(v, raster_lim, grid_step):
+    img = np.zeros((GRID_PX, GRID_PX, 4))
+    for segments in compute_minkowski_grid(v, raster_lim, grid_step):
+        stamp_segments(img, segments, raster_lim, (0.0, 0.0, 1.0), 0.3)
+    return (img * 255).round().astype(np.uint8)
+
+# plot_lim moves continuously with the events; rasterize over plot_lim rounded up
+# to a whole grid step so event edits reuse the cached image, and let the axes crop it
+raster_lim = float(np.ceil(plot_lim / grid_step) * grid_step)
+ax.imshow(grid_background(v, raster_lim, grid_step), extent=[-raster_lim, raster_lim, -raster_lim, raster_lim],
+          origin='lower', zorder=0)
 
 
 # Plot rest‑frame events A & B
@@ -133,7 +185,7 @@ else: # S' (moving frame)
 
 ax.legend(loc='upper left')
 ax.set_title("Minkowski Diagram (c=1 units)")
-st.pyplot(fig)
+st.pyplot(fig, clear_figure=False)
 
 st.markdown("""
 <hr style='margin-top: 50px; margin-bottom: 10px'>
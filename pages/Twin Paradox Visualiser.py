@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+from figures import session_subplots
+import sr_utils
 
 # Set up
 st.set_page_config(page_title="Twin Paradox Simulator", layout="centered")
@@ -35,7 +36,7 @@ unit_factors = {
 T_seconds = T_raw * unit_factors[unit]
 
 # ---------------- CALCULATION ----------------
-gamma = 1 / np.sqrt(1 - v**2)
+gamma = sr_utils.gamma(v)
 tau_A = T_seconds
 tau_B = T_seconds / gamma
 delta_tau = tau_A - tau_B
@@ -57,7 +58,7 @@ col3, col4 = st.columns(2)
 
 with col3:
     st.subheader("🌌 Spacetime Diagram")
-    fig, ax = plt.subplots(figsize=(5, 5))
+    fig, ax = session_subplots("fig_twin_paradox", figsize=(5, 5))
     ax.plot([0, 0], [0, T_display], label="Earth twin", color="blue")
     ax.plot(x_travel, t_travel, label="Traveling twin", color="red")
     ax.set_xlabel("x")
@@ -67,7 +68,7 @@ with col3:
     ax.set_title("Worldlines")
     ax.legend()
     ax.grid(True)
-    st.pyplot(fig)
+    st.pyplot(fig, clear_figure=False)
 
 with col4:
     st.subheader("📊 Results")
@@ -1,6 +1,6 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+from figures import session_subplots
 
 # Set up Streamlit
 st.set_page_config(page_title="Relativistic Velocity Addition", layout="centered")
@@ -35,7 +35,7 @@ st.subheader("📈 Velocity Addition Curve")
 v_vals = np.linspace(0, 0.999, 300)
 v_combined_vals = relativistic_velocity_addition(v_vals, v2)
 
-fig, ax = plt.subplots(figsize=(8, 5))
+fig, ax = session_subplots("fig_velocity_addition", figsize=(8, 5))
 ax.plot(v_vals, v_combined_vals, label=rf"$v_2 = {v2:.2f}c$", color='blue')
 ax.axhline(1, color='red', linestyle='--', label='Speed of Light ($c$)')
 ax.set_xlabel(r"$v_1$ (fraction of $c$)")
@@ -43,7 +43,7 @@ ax.set_ylabel(r"$v$ (combined)")
 ax.set_title("Relativistic Velocity Addition")
 ax.legend()
 ax.grid(True)
-st.pyplot(fig)
+st.pyplot(fig, clear_figure=False)
 
 st.markdown("""
 <hr style='margin-top: 50px; margin-bottom: 10px'>
@@ -0,0 +1,49 @@
+import numpy as np
+
+# — Ahead-of-time compiled kernels (c = 1) —
+# `python sr_native.py` builds a native sr_native extension next to this file.
+# Once built it shadows this module on import (extension modules win over .py),
+# so pages pay no JIT warm-up. Without the build the same functions are JIT
+# compiled on first use, or run as plain NumPy if numba is not installed.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+# name -> (signature, python function), compiled by the __main__ build below
+_exports = {}
+
+def export(name, sig):
+    def register(f):
+        _exports[name] = (sig, f)
+        return njit(cache=True)(f)
+    return register
+
+# f_obs / f_emit for a source receding at beta (negative beta = approaching)
+@export("doppler_factor", "f8(f8)")
+def doppler_factor(beta):
+    return np.sqrt((1.0 - beta) / (1.0 + beta))
+
+# Lorentz boost along x of many events; boosting by -v maps S′ back to S
+@export("boost", "UniTuple(f8[:], 2)(f8[:], f8[:], f8)")
+def boost(x, t, v):
+    g = 1.0 / np.sqrt((1.0 - v) * (1.0 + v))
+    return g * (x - v * t), g * (t - v * x)
+
+# Same boost for a single event
+@export("boost_event", "UniTuple(f8, 2)(f8, f8, f8)")
+def boost_event(x, t, v):
+    g = 1.0 / np.sqrt((1.0 - v) * (1.0 + v))
+    return g * (x - v * t), g * (t - v * x)
+
+if __name__ == "__main__":
+    # pycc is only needed for the build, so the app never imports it
+    try:
+        from numba.pycc import CC
+    except ImportError:
+        raise SystemExit("numba (with numba.pycc) is required to build the sr_native extension")
+    cc = CC("sr_native")
+    for name, (sig, f) in _exports.items():
+        cc.export(name, sig)(f)
+    cc.compile()
@@ -0,0 +1,37 @@
+import math
+from functools import lru_cache
+
+# — Shared special-relativity helpers (c = 1) —
+# Scalar-only and memoized: pages call these with the same slider/input values
+# on every rerun.
+@lru_cache(maxsize=256)
+def gamma(v: float) -> float:
+    return 1.0 / math.sqrt((1.0 - v) * (1.0 + v))
+
+# (γ, γv) from a single sqrt, for E = γm and p = γmv
+@lru_cache(maxsize=256)
+def gamma_beta(v: float) -> tuple[float, float]:
+    g = gamma(v)
+    return g, v * g
+
+# 1 - v² for a speed typed as text, exact to float precision even when v is
+# too close to 0 or 1 for float64 to hold; raises ValueError unless 0 < v < 1
+def one_minus_v2(v_str: str) -> float:
+    v_str = v_str.strip()
+    v = float(v_str)
+    if 0.0 < v < 1.0:
+        # (1 - v)(1 + v) avoids the cancellation in 1 - v**2
+        return (1.0 - v) * (1.0 + v)
+    if not 0.0 <= v <= 1.0:
+        raise ValueError("Velocity (v/c) must be strictly between 0 and 1.")
+    # v rounded to 0 or 1 in float64: settle it from the exact input digits
+    from mpmath import mp # imported only on this rare path
+    with mp.workdps(len(v_str) + 10):
+        v_mp = mp.mpf(v_str)
+        if not 0 < v_mp < 1:
+            raise ValueError("Velocity (v/c) must be strictly between 0 and 1.")
+        w = float((1 - v_mp) * (1 + v_mp))
+    if w == 0.0:
+        # 1 - v² below ~1e-324 underflows float64; γ would be infinite
+        raise ValueError("Velocity (v/c) is too close to 1 to represent")
+    return w